@@ -164,22 +164,41 @@ class Bunch(BaseField):
 
     def __setup_fields__(self) -> None:
         # Set up the Bunch fields as instance attributes.
-        # First, look up internal dataclass attribute names.
 
-        fields_attr: str = getattr(dataclasses, "_FIELDS")  # noqa: B009
-        field_type: Any = getattr(dataclasses, "_FIELD")  # noqa: B009
-        fields: dict[str, dataclasses.Field[Any]] = getattr(self, fields_attr, {})
+        for name, factory in self._fieldFactories():
+            setattr(self, name, factory())
 
-        # Then look up the fields stored in the dataclass.
+    @classmethod
+    def _fieldFactories(cls) -> tuple[tuple[str, Callable[[], Any]], ...]:
+        # Returns the names and factories of the fields stored in this
+        # dataclass. They are only looked up once per class, and then stored on
+        # the class itself. Note the use of vars(), in order to look them up
+        # for this specific class, and not one of its parents.
 
-        for field in fields.values():
-            if getattr(field, "_field_type", None) is not field_type:
-                continue
+        factories_attr = "__FIELD_FACTORIES"
 
-            if field.default_factory is dataclasses.MISSING:
-                continue
+        factories: tuple[tuple[str, Callable[[], Any]], ...] | None = vars(cls).get(
+            factories_attr
+        )
+
+        if factories is None:
+            # First, look up internal dataclass attribute names.
+
+            fields_attr: str = getattr(dataclasses, "_FIELDS")  # noqa: B009
+            field_type: Any = getattr(dataclasses, "_FIELD")  # noqa: B009
+            fields: dict[str, dataclasses.Field[Any]] = getattr(cls, fields_attr, {})
+
+            # Then look up the fields stored in the dataclass.
 
-            setattr(self, field.name, field.default_factory())
+            factories = tuple(
+                (field.name, field.default_factory)
+                for field in fields.values()
+                if getattr(field, "_field_type", None) is field_type
+                and field.default_factory is not dataclasses.MISSING
+            )
+            setattr(cls, factories_attr, factories)
+
+        return factories
 
     def __init__(self) -> None:
         super().__init__()
@@ -190,12 +209,25 @@ class Bunch(BaseField):
         self._update_notifier = Notifier()
         self._loaded_notifier = Notifier()
 
-        for label, field in vars(self).items():
-            if isinstance(field, Field):
-                self._fields[label] = field
-                field.meta().update(label=label, container=self)
-                field._update_notifier.add(self._update_notifier.trigger)  # noqa: SLF001
-                self._loaded_notifier.add(field._loaded_notifier.trigger)  # noqa: SLF001
+        # Checking an instance against a runtime protocol is expensive. All the
+        # instances of a given class have the same fields, so only do it for
+        # the first one, and store the resulting labels on the class.
+
+        labels_attr = "__FIELD_LABELS"
+
+        labels: tuple[str, ...] | None = vars(type(self)).get(labels_attr)
+        if labels is None:
+            labels = tuple(
+                label for label, field in vars(self).items() if isinstance(field, Field)
+            )
+            setattr(type(self), labels_attr, labels)
+
+        for label in labels:
+            field: Field = getattr(self, label)
+            self._fields[label] = field
+            field.meta().update(label=label, container=self)
+            field._update_notifier.add(self._update_notifier.trigger)  # noqa: SLF001
+            self._loaded_notifier.add(field._loaded_notifier.trigger)  # noqa: SLF001
 
         self.__post_init__()
 
@@ -93,8 +93,31 @@ class Key(Generic[_T], BaseField, Lockable):
     36
     """
 
+    # Applications can hold a great many Keys, so keep their footprint small.
+    # Note that this only does away with the instance dict because the base
+    # classes, Lockable and BaseField, declare empty slots as well.
+
+    __slots__ = (
+        "__weakref__",
+        "_bad_value_string",
+        "_children_ref",
+        "_default",
+        "_fallback_value",
+        "_loaded_notifier",
+        "_lock",
+        "_metadata",
+        "_parent_ref",
+        "_serializer",
+        "_type",
+        "_update_notifier",
+        "_validator",
+        "_value",
+        "_value_change_notifier",
+    )
+
     _default: _T
     _value: _T | None
+    _fallback_value: _T
     _serializer: Serializer[_T]
     _validator: Callable[[_T], bool]
     _bad_value_string: str | None
@@ -132,7 +155,9 @@ class Key(Generic[_T], BaseField, Lockable):
 
         self._default = default
         self._value = None
+        self._fallback_value = default
         self._bad_value_string = None
+        self._metadata = None
 
         if serializer is None:
             serializer = lookup(self._type)
@@ -171,7 +196,7 @@ class Key(Generic[_T], BaseField, Lockable):
             This Key's apparent value.
         """
 
-        return self.fallback() if (value := self._value) is None else value
+        return self._fallback_value if (value := self._value) is None else value
 
     def fallback(self) -> _T:
         """
@@ -182,7 +207,11 @@ class Key(Generic[_T], BaseField, Lockable):
         value for the Key if not.
         """
 
-        return self._default if (parent := self.parent()) is None else parent.get()
+        # Note that this value is computed ahead of time, and kept up to date
+        # whenever this Key's parent or its parent's value changes. See
+        # _updateFallback().
+
+        return self._fallback_value
 
     def set(self, value: _T) -> bool:
         """
@@ -198,6 +227,14 @@ class Key(Generic[_T], BaseField, Lockable):
             the validator refused the value.
         """
 
+        return self._setValue(value, notify_update=True)
+
+    def _setValue(self, value: _T, *, notify_update: bool) -> bool:
+        """
+        Internal. Validates and sets the given value on this Key, and calls the
+        update callbacks if `notify_update` is True.
+        """
+
         # Safety check in case the user is holding it wrong.
 
         if not isinstance(value, self._type):
@@ -216,12 +253,19 @@ class Key(Generic[_T], BaseField, Lockable):
 
         self._value = value
 
-        if prev_value != self.get():
-            self._value_change_notifier.trigger(self.get())
-            for child in self.children():
-                child._notifyParentValueChanged()  # noqa: SLF001
+        # Setting the very object this Key already holds or inherits happens
+        # with singletons such as bools or enum members, or when a value
+        # obtained from get() is passed back to set(). Then there is nothing to
+        # tell the value change callbacks or the children about, so skip that
+        # entirely.
+
+        if value is prev_value:
+            changed = False
+        else:
+            changed = prev_value != value
+            self._propagateValueChange(prev_value, notify=True)
 
-        if not previously_set or prev_value != self.get():
+        if notify_update and (not previously_set or changed):
             self._update_notifier.trigger(self)
 
         return True
@@ -240,11 +284,7 @@ class Key(Generic[_T], BaseField, Lockable):
 
         prev_value = self.get()
         self._value = None
-
-        if prev_value != self.get():
-            self._value_change_notifier.trigger(self.get())
-            for child in self.children():
-                child._notifyParentValueChanged()  # noqa: SLF001
+        self._propagateValueChange(prev_value, notify=True)
 
         self._update_notifier.trigger(self)
 
@@ -378,22 +418,36 @@ class Key(Generic[_T], BaseField, Lockable):
         if parent is not None and type(self) is not type(parent):
             return
 
+        if parent is not None and parent._type is not self._type:  # noqa: SLF001
+            # This should not happen... unless the user is holding it wrong.
+            # So, better safe than sorry.
+
+            return
+
         old_parent = self.parent()
         if old_parent is not None:
             old_parent._children_ref.discard(self)  # noqa: SLF001
 
         if parent is None:
             self._parent_ref = None
-            return
 
-        if parent._type is not self._type:  # noqa: SLF001
-            # This should not happen... unless the user is holding it wrong.
-            # So, better safe than sorry.
+        else:
+            parent._children_ref.add(self)  # noqa: SLF001
 
-            return
+            # When the parent goes away, this Key falls back to its default
+            # value again, so its fallback value needs to be updated. Note
+            # that the callback only keeps a weak reference to this Key, so as
+            # not to create a reference cycle.
+
+            self_ref = weakref.ref(self)
 
-        parent._children_ref.add(self)  # noqa: SLF001
-        self._parent_ref = weakref.ref(parent)
+            def on_parent_deleted(_: object) -> None:
+                if (key := self_ref()) is not None:
+                    key._updateFallback(notify=False)  # noqa: SLF001
+
+            self._parent_ref = weakref.ref(parent, on_parent_deleted)
+
+        self._updateFallback(notify=False)
 
     def parent(self) -> Self | None:
         """
@@ -420,18 +474,24 @@ class Key(Generic[_T], BaseField, Lockable):
         for child in self._children_ref:
             yield cast(Self, child)
 
-    def dumpFields(self) -> Iterator[tuple[str, str | None]]:
-        if not self.skipOnSave():
-            if self.isSet():
-                yield "", self._serializer.toStr(self.get())
+    def dumpFields(self) -> list[tuple[str, str | None]]:
+        # A Key dumps at most one field, so return it in a plain list rather
+        # than paying for a generator.
+
+        if (value := self._value) is None and self._bad_value_string is None:
+            return []
 
-            elif self._bad_value_string is not None:
-                # If a bad value was set in the settings file for this Key, and
-                # the Key was not modified since, then save the bad value again.
-                # This way, typos in the settings file don't outright destroy
-                # the entry.
+        if self.skipOnSave():
+            return []
 
-                yield "", self._bad_value_string
+        if value is not None:
+            return [("", self._serializer.toStr(value))]
+
+        # If a bad value was set in the settings file for this Key, and the Key
+        # was not modified since, then save the bad value again. This way, typos
+        # in the settings file don't outright destroy the entry.
+
+        return [("", self._bad_value_string)]
 
     def restoreField(self, path: str, value: str | None) -> bool:
         if value is None:
@@ -445,25 +505,53 @@ class Key(Generic[_T], BaseField, Lockable):
             # incorrect.
             return False
 
-        with self._update_notifier.inhibit():
-            if (val := self._serializer.fromStr(value)) is not None:
-                return self.set(val)
+        # Restoring a value is not considered an update of this Key, so don't
+        # call the update callbacks.
 
-            # Keep track of the value that failed to restore, so that we can dump it
-            # again when saving. That way, if a user makes a typo while editing the
-            # settings file, the faulty entry is not entirely lost when we save.
+        if (val := self._serializer.fromStr(value)) is not None:
+            return self._setValue(val, notify_update=False)
 
-            logging.error("Invalid value for Key %r: %s", self, value)
-            self._bad_value_string = value
-            return False
+        # Keep track of the value that failed to restore, so that we can dump it
+        # again when saving. That way, if a user makes a typo while editing the
+        # settings file, the faulty entry is not entirely lost when we save.
 
-    def _notifyParentValueChanged(self) -> None:
-        if self.isSet():
-            return
+        logging.error("Invalid value for Key %r: %s", self, value)
+        self._bad_value_string = value
+        return False
+
+    def _propagateValueChange(self, prev_value: _T, *, notify: bool) -> None:
+        """
+        Internal. Informs the children of this Key that its apparent value may
+        have changed from the given previous value, and calls the value change
+        callbacks if it did and `notify` is True.
+        """
+
+        value = self.get()
+        changed = prev_value != value
 
-        self._value_change_notifier.trigger(self.get())
-        for child in self.children():
-            child._notifyParentValueChanged()  # noqa: SLF001
+        if changed and notify:
+            self._value_change_notifier.trigger(value)
+
+        # Note that the children need to be informed even if the new value
+        # compares equal to the previous one, so that their fallback value is
+        # the exact same object as this Key's value.
+
+        if changed or value is not prev_value:
+            for child in self.children():
+                child._updateFallback(notify=notify)  # noqa: SLF001
+
+    def _updateFallback(self, *, notify: bool) -> None:
+        """
+        Internal. Recomputes the value this Key falls back to when it does not
+        have a value set, after its parent or its parent's value changed.
+        """
+
+        prev_value = self.get()
+        parent = self.parent()
+        self._fallback_value = self._default if parent is None else parent.get()
+
+        if not self.isSet():
+            self._propagateValueChange(prev_value, notify=notify)
 
     def _typeHint(self) -> GenericAlias:
         return GenericAlias(type(self), self._type)
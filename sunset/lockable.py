@@ -16,6 +16,8 @@ class Lockable:
     against one another.
     """
 
+    __slots__ = ()
+
     _lock: threading.RLock
 
     def __init__(self) -> None:
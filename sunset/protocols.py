@@ -1,6 +1,6 @@
 import sys
 import weakref
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from types import GenericAlias
 from typing import Any, Generic, Protocol, TypeVar, runtime_checkable
@@ -87,7 +87,7 @@ class Inheriter(Protocol):
 
 @runtime_checkable
 class Dumpable(Protocol):
-    def dumpFields(self) -> Iterator[tuple[str, str | None]]: ...
+    def dumpFields(self) -> Iterable[tuple[str, str | None]]: ...
 
     def restoreField(self, path: str, value: str | None) -> bool: ...
 
@@ -165,6 +165,8 @@ class Field(
 
 
 class BaseField:
+    __slots__ = ()
+
     _PATH_SEPARATOR: str = "."
 
     _metadata: Metadata | None = None
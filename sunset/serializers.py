@@ -1,5 +1,6 @@
 import enum
-from typing import Generic, TypeVar
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
 
 from sunset.enum_serializer import EnumSerializer
 from sunset.protocols import Serializable, Serializer
@@ -9,17 +10,51 @@ _Serializable = TypeVar("_Serializable", bound=Serializable)
 _Castable = TypeVar("_Castable", int, float, str)
 _Bool = TypeVar("_Bool", bound=bool)
 
+_TRUE_STRINGS = frozenset(("true", "yes", "y", "1"))
+_FALSE_STRINGS = frozenset(("false", "no", "n", "0"))
+
+
+def _mayBeInt(string: str) -> bool:
+    # A cheap necessary condition for int() to accept the string: after
+    # whitespace and sign, it must start with a digit.
+
+    return string.lstrip().lstrip("+-")[:1].isdigit()
+
+
+def _mayBeFloat(string: str) -> bool:
+    # Same as above for float(), which also accepts a leading dot, as well as
+    # 'inf', 'infinity' and 'nan' in any case.
+
+    start = string.lstrip().lstrip("+-")[:1]
+    return start.isdigit() or start in (".", "i", "I", "n", "N")
+
+
+# Only used for these exact types: subclasses may well accept other strings.
+
+_PRECHECKS: dict[type, Callable[[str], bool]] = {
+    int: _mayBeInt,
+    float: _mayBeFloat,
+}
+
 
 class StraightCastSerializer(Generic[_Castable]):
     _type: type[_Castable]
+    _precheck: Callable[[str], bool] | None
 
     def __init__(self, type_: type[_Castable]) -> None:
         self._type = type_
+        self._precheck = _PRECHECKS.get(type_)
 
     def toStr(self, value: _Castable) -> str:
         return str(value)
 
     def fromStr(self, string: str) -> _Castable | None:
+        # Rejecting obviously invalid strings upfront is much cheaper than
+        # raising and catching an exception.
+
+        if (precheck := self._precheck) is not None and not precheck(string):
+            return None
+
         try:
             return self._type(string)
         except ValueError:
@@ -35,9 +70,9 @@ class BoolSerializer(Generic[_Bool]):
 
     def fromStr(self, string: str) -> _Bool | None:
         string = string.strip().lower()
-        if string in ("true", "yes", "y", "1"):
+        if string in _TRUE_STRINGS:
             return self._type(True)  # noqa: FBT003
-        if string in ("false", "no", "n", "0"):
+        if string in _FALSE_STRINGS:
             return self._type(False)  # noqa: FBT003
         return None
 
@@ -55,7 +90,23 @@ class SerializableSerializer(Generic[_Serializable]):
         return self._type.fromStr(string)
 
 
+# Serializers for the most common exact types, looked up in a single dict access
+# before falling back to the more expensive subclass checks below. These
+# serializers are stateless beyond the type they hold, so they can be shared
+# between Keys.
+
+_SERIALIZERS_BY_TYPE: dict[type, Serializer[Any]] = {
+    bool: BoolSerializer(bool),
+    int: StraightCastSerializer(int),
+    float: StraightCastSerializer(float),
+    str: StraightCastSerializer(str),
+}
+
+
 def lookup(type_: type[_T]) -> Serializer[_T] | None:
+    if (serializer := _SERIALIZERS_BY_TYPE.get(type_)) is not None:
+        return serializer
+
     if issubclass(type_, Serializable):
         return SerializableSerializer(type_)
 
@@ -80,6 +80,7 @@ class WeakCallableSet(MutableSet[_C]):
     """
 
     _content: NonHashableSet[weakref.ReferenceType[_C]]
+    _snapshot: tuple[weakref.ReferenceType[_C], ...] | None
 
     def __init__(self) -> None:
         super().__init__()
@@ -91,6 +92,15 @@ class WeakCallableSet(MutableSet[_C]):
 
         self._content = NonHashableSet()
 
+        # Iteration goes through an immutable snapshot of the references, which
+        # is only rebuilt after the contents change. Callables are typically
+        # iterated on far more often than they are added or removed, and this
+        # lets them add or discard callables while being iterated on. The
+        # snapshot is guarded by the lock of the underlying set, so that it is
+        # invalidated in the same critical section as the contents change.
+
+        self._snapshot = None
+
     def add(self, value: _C) -> None:
         if isinstance(value, MethodType):
             r: weakref.ReferenceType[_C] = weakref.WeakMethod(
@@ -100,13 +110,15 @@ class WeakCallableSet(MutableSet[_C]):
         else:
             r = weakref.ref(value, self._onExpire)
 
-        self._content.add(r)
+        with self._content._lock:  # noqa: SLF001
+            self._content.add(r)
+            self._snapshot = None
 
     def __contains__(self, value: object) -> bool:
         return any(self._isSameCallable(candidate, value) for candidate in self)
 
     def __iter__(self) -> Iterator[_C]:
-        for ref in self._content:
+        for ref in self._refs():
             value = ref()
             if value is not None:
                 yield value
@@ -116,13 +128,16 @@ class WeakCallableSet(MutableSet[_C]):
 
     def discard(self, value: _C) -> None:
         to_discard: list[weakref.ReferenceType[_C]] = []
-        for ref in self._content:
+        for ref in self._refs():
             callable_ = ref()
             if callable_ is not None and self._isSameCallable(callable_, value):
                 to_discard.append(ref)
 
-        for ref in to_discard:
-            self._content.discard(ref)
+        if to_discard:
+            with self._content._lock:  # noqa: SLF001
+                for ref in to_discard:
+                    self._content.discard(ref)
+                self._snapshot = None
 
     @staticmethod
     def _isSameCallable(callable1: _C, callable2: object) -> bool:
@@ -134,5 +149,14 @@ class WeakCallableSet(MutableSet[_C]):
 
         return callable1 is callable2
 
+    def _refs(self) -> tuple[weakref.ReferenceType[_C], ...]:
+        if (snapshot := self._snapshot) is None:
+            with self._content._lock:  # noqa: SLF001
+                if (snapshot := self._snapshot) is None:
+                    snapshot = self._snapshot = tuple(self._content)
+        return snapshot
+
     def _onExpire(self, ref: weakref.ReferenceType[_C]) -> None:
-        self._content.discard(ref)
+        with self._content._lock:  # noqa: SLF001
+            self._content.discard(ref)
+            self._snapshot = None
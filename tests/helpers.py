@@ -0,0 +1,73 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import zip_longest
+from typing import Any, Optional
+
+
+class ExampleSerializable:
+    def __init__(self, value: str) -> None:
+        self._value = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExampleSerializable):
+            return NotImplemented
+        return self._value == other._value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+    def toStr(self) -> str:
+        return self._value
+
+    @staticmethod
+    def fromStr(string: str) -> Optional["ExampleSerializable"]:
+        return ExampleSerializable(string)
+
+
+class CallRecorder:
+    """
+    A minimal stand-in for mock stubs, recording the arguments it is called
+    with.
+    """
+
+    __slots__ = ("__weakref__", "calls")
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[Any, ...]] = []
+
+    def __call__(self, *args: Any) -> None:
+        self.calls.append(args)
+
+    def assert_called_once_with(self, *args: Any) -> None:
+        assert self.calls == [args]
+
+    def assert_not_called(self) -> None:
+        assert not self.calls
+
+    def reset_mock(self) -> None:
+        self.calls.clear()
+
+
+@contextmanager
+def expect_one_call(recorder: CallRecorder, *args: Any) -> Iterator[None]:
+    """
+    Asserts that the recorder is called exactly once, with the given
+    arguments, within the context.
+    """
+
+    before = len(recorder.calls)
+    yield
+    assert recorder.calls[before:] == [args]
+
+
+_EXHAUSTED = object()
+
+
+def assert_stream_equal(stream: Iterable[Any], expected: Iterable[Any]) -> None:
+    """
+    Asserts that the given iterable yields the expected items, consuming it
+    one item at a time rather than materializing it first.
+    """
+
+    for item, expected_item in zip_longest(stream, expected, fillvalue=_EXHAUSTED):
+        assert item == expected_item
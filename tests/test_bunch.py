@@ -292,6 +292,7 @@ class TestBunch:
         other_bunch.restoreField("", "invalid path")
         assert not other_bunch.isSet()
 
+    @pytest.mark.gc_sensitive
     def test_persistence(self) -> None:
         # A Bunch does not keep a reference to its parent or children.
 
@@ -302,12 +303,12 @@ class TestBunch:
         level2.setParent(level1)
 
         assert level1.parent() is not None
-        assert len(list(level1.children())) == 1
+        assert sum(1 for _ in level1.children()) == 1
 
         del bunch
         del level2
         assert level1.parent() is None
-        assert len(list(level1.children())) == 0
+        assert sum(1 for _ in level1.children()) == 0
 
     def test_key_updated_notification(self, mocker: MockerFixture) -> None:
         callback = mocker.stub()
@@ -1,31 +1,75 @@
-from collections.abc import Iterator
+import gc
+import sys
+import weakref
+from collections.abc import Callable, Iterator
+from typing import Any
 
-from pytest_mock import MockerFixture
+import pytest
 
 from sunset import Bunch, Key, List, protocols
+from sunset.list import IterOrder
+from tests.helpers import CallRecorder, assert_stream_equal, expect_one_call
 
 
 class ExampleBunch(Bunch):
     test = Key("")
 
 
+class ExamplePrivateListBunch(Bunch):
+    key_list = List(Key(""))
+    _private = List(Key(""))
+
+
+class ExampleStrListBunch(Bunch):
+    str_list = List(Key("default"))
+
+
+def flatten(keys: Iterator[Key[str]]) -> tuple[str, ...]:
+    return tuple(map(Key.get, keys))
+
+
+def str_keys(*values: str | None) -> list[Key[str]]:
+    # Builds one str Key per given value, left unset where the value is None.
+
+    keys: list[Key[str]] = []
+    for value in values:
+        key = Key("")
+        if value is not None:
+            key.set(value)
+        keys.append(key)
+    return keys
+
+
+@pytest.fixture
+def callback() -> CallRecorder:
+    return CallRecorder()
+
+
+@pytest.fixture
+def int_list() -> List[Key[int]]:
+    return List(Key(default=0))
+
+
+@pytest.fixture
+def str_list() -> List[Key[str]]:
+    return List(Key(default=""))
+
+
 class TestList:
-    def test_protocol_implementation(self) -> None:
-        list_key: List[Key[int]] = List(Key(default=0))
-        assert isinstance(list_key, protocols.Field)
+    def test_protocol_implementation(self, int_list: List[Key[int]]) -> None:
+        assert isinstance(int_list, protocols.Field)
 
-    def test_add_pop(self) -> None:
-        list_key: List[Key[str]] = List(Key(default=""))
-        list_key.appendOne()
+    def test_add_pop(self, str_list: List[Key[str]]) -> None:
+        str_list.appendOne()
 
-        assert len(list_key) == 1
+        assert len(str_list) == 1
 
-        list_key[0].set("test")
-        assert list_key[0].get() == "test"
+        str_list[0].set("test")
+        assert str_list[0].get() == "test"
 
-        list_key.pop()
+        str_list.pop()
 
-        assert len(list_key) == 0
+        assert len(str_list) == 0
 
     def test_inheritance(self) -> None:
         parent_list: List[Key[int]] = List(Key(default=0))
@@ -66,178 +110,162 @@ class TestList:
         assert child_list not in list2.children()
         assert child_list.parent() is None
 
-    def test_iter_inheritance(self) -> None:
-        def flatten(keys: Iterator[Key[str]]) -> list[str]:
-            return [key.get() for key in keys]
-
+    @pytest.mark.parametrize(
+        ("order", "expected"),
+        [
+            (List.NO_PARENT, ("child",)),
+            (List.PARENT_FIRST, ("parent", "child")),
+            (List.PARENT_LAST, ("child", "parent")),
+        ],
+        ids=["NO_PARENT", "PARENT_FIRST", "PARENT_LAST"],
+    )
+    def test_iter_inheritance(
+        self, order: IterOrder, expected: tuple[str, ...]
+    ) -> None:
         parent: List[Key[str]] = List(Key(default=""))
-        child_default: List[Key[str]] = List(Key(default=""))
-        child_iter_no_parent: List[Key[str]] = List(
-            Key(default=""), order=List.NO_PARENT
-        )
-        child_iter_parent_first: List[Key[str]] = List(
-            Key(default=""), order=List.PARENT_FIRST
-        )
-        child_iter_parent_last: List[Key[str]] = List(
-            Key(default=""), order=List.PARENT_LAST
-        )
-
         parent.appendOne().set("parent")
+
+        child: List[Key[str]] = List(Key(default=""), order=order)
+        child.appendOne().set("child")
+        child_default: List[Key[str]] = List(Key(default=""))
         child_default.appendOne().set("child")
-        child_iter_no_parent.appendOne().set("child")
-        child_iter_parent_first.appendOne().set("child")
-        child_iter_parent_last.appendOne().set("child")
 
-        assert flatten(child_default.iter()) == ["child"]
+        # Without a parent, a List only iterates over its own items.
+
+        assert flatten(child.iter()) == ("child",)
 
+        child.setParent(parent)
         child_default.setParent(parent)
-        child_iter_no_parent.setParent(parent)
-        child_iter_parent_first.setParent(parent)
-        child_iter_parent_last.setParent(parent)
-
-        assert flatten(child_default.iter()) == ["child"]
-        assert flatten(child_iter_no_parent.iter()) == ["child"]
-        assert flatten(child_iter_parent_first.iter()) == ["parent", "child"]
-        assert flatten(child_iter_parent_last.iter()) == ["child", "parent"]
-        assert flatten(child_default.iter(order=List.NO_PARENT)) == ["child"]
-        assert flatten(child_default.iter(order=List.PARENT_FIRST)) == [
-            "parent",
-            "child",
-        ]
-        assert flatten(child_default.iter(order=List.PARENT_LAST)) == [
-            "child",
-            "parent",
-        ]
+
+        # The order is given either at construction or when iterating.
+
+        assert flatten(child.iter()) == expected
+        assert flatten(child_default.iter(order=order)) == expected
+
+        # By default, a List does not iterate over its parent.
+
+        assert flatten(child_default.iter()) == ("child",)
 
     def test_dump_fields(self) -> None:
         key_list = List(Key(""))
-        key_list.appendOne().set("test 1")
-        key_list.appendOne()
-        key_list.appendOne().set("test 3")
-        assert list(key_list.dumpFields()) == [
-            ("1", "test 1"),
-            ("2", None),
-            ("3", "test 3"),
-        ]
+        key_list.extend(str_keys("test 1", None, "test 3"))
+        assert_stream_equal(
+            key_list.dumpFields(),
+            (
+                ("1", "test 1"),
+                ("2", None),
+                ("3", "test 3"),
+            ),
+        )
 
         bunch_list = List(ExampleBunch())
         bunch_list.appendOne().test.set("test 1")
         bunch_list.appendOne()
         bunch_list.appendOne().test.set("test 3")
         bunch_list.appendOne()
-        assert list(bunch_list.dumpFields()) == [
-            ("1.test", "test 1"),
-            ("2", None),
-            ("3.test", "test 3"),
-            ("4", None),
-        ]
+        assert_stream_equal(
+            bunch_list.dumpFields(),
+            (
+                ("1.test", "test 1"),
+                ("2", None),
+                ("3.test", "test 3"),
+                ("4", None),
+            ),
+        )
 
         key_list = List(Key(""))
-        key_list.appendOne()
-        key_list.appendOne().set("")
-        key_list.appendOne()
-        assert list(key_list.dumpFields()) == [
-            ("1", None),
-            ("2", ""),
-            ("3", None),
-        ]
-
-        class TestBunch(Bunch):
-            key_list = List(Key(""))
-            _private = List(Key(""))
-
-        bunch = TestBunch()
+        key_list.extend(str_keys(None, "", None))
+        assert_stream_equal(
+            key_list.dumpFields(),
+            (
+                ("1", None),
+                ("2", ""),
+                ("3", None),
+            ),
+        )
+
+        bunch = ExamplePrivateListBunch()
         bunch.key_list.appendOne().set("test public")
         bunch._private.appendOne().set("test private")
-        assert list(bunch.dumpFields()) == [
-            ("key_list.1", "test public"),
-        ]
-
-    def test_restore_field(self, mocker: MockerFixture) -> None:
-        callback = mocker.stub()
+        assert_stream_equal(bunch.dumpFields(), (("key_list.1", "test public"),))
 
+    def test_restore_field(self, callback: CallRecorder) -> None:
         # Test restoring one value. Also, restoring a field should not trigger a
         # callback.
 
-        test_list1 = List(Key("default"))
-        test_list1.onUpdateCall(callback)
-        assert test_list1.restoreField("1", "test")
-        assert len(test_list1) == 1
-        assert test_list1[0].get() == "test"
+        test_list = List(Key("default"))
+        test_list.onUpdateCall(callback)
+        assert test_list.restoreField("1", "test")
+        assert len(test_list) == 1
+        assert test_list[0].get() == "test"
         callback.assert_not_called()
 
         # Test overwriting a restored value.
 
-        assert test_list1.restoreField("1", "other test")
-        assert len(test_list1) == 1
-        assert test_list1[0].get() == "other test"
+        assert test_list.restoreField("1", "other test")
+        assert len(test_list) == 1
+        assert test_list[0].get() == "other test"
         callback.assert_not_called()
 
         # Test restoring a value that requires extending the List.
 
-        assert test_list1.restoreField("5", "extension test")
-        assert len(test_list1) == 5
-        assert test_list1[4].get() == "extension test"
-        callback.assert_not_called()
-
-        # Test different kinds of invalid restore paths.
-
-        test_list2 = List(Key("default"))
-        test_list2.onUpdateCall(callback)
-
-        assert not test_list2.restoreField("", "test")
-        assert len(test_list2) == 0
-        callback.assert_not_called()
-
-        assert not test_list2.restoreField("invalid", "test")
-        assert len(test_list2) == 0
-        callback.assert_not_called()
-
-        assert not test_list2.restoreField("invalid.1", "test")
-        assert len(test_list2) == 0
+        assert test_list.restoreField("5", "extension test")
+        assert len(test_list) == 5
+        assert test_list[4].get() == "extension test"
         callback.assert_not_called()
 
-        assert not test_list2.restoreField(".", "test")
-        assert len(test_list2) == 0
-        callback.assert_not_called()
-
-        assert not test_list2.restoreField("0", "test")
-        assert len(test_list2) == 0
-        callback.assert_not_called()
-
-        # Test indirect restore path.
-
-        class TestBunch(Bunch):
-            str_list = List(Key("default"))
-
-        bunch = TestBunch()
+    def test_restore_field_indirect_path(self, callback: CallRecorder) -> None:
+        bunch = ExampleStrListBunch()
         bunch.str_list.onUpdateCall(callback)
         assert bunch.restoreField("str_list.1", "test")
         assert len(bunch.str_list) == 1
         assert bunch.str_list[0].get() == "test"
         callback.assert_not_called()
 
-        # Test an invalid restore value.
-
-        test_list3 = List(Key("default"))
-        test_list3.onUpdateCall(callback)
-        assert not test_list3.restoreField(".size", "invalid")
-        assert len(test_list3) == 0
+    def test_restore_field_empty_items(self, callback: CallRecorder) -> None:
+        test_list = List(Key("default"))
+        test_list.onUpdateCall(callback)
+        assert test_list.restoreField("1", None)
+        assert test_list.restoreField("2", "")
+        assert test_list.restoreField("3", None)
+        assert len(test_list) == 3
+        assert not test_list[0].isSet()
+        assert test_list[1].isSet() and test_list[1].get() == ""
+        assert not test_list[2].isSet()
         callback.assert_not_called()
 
-        # Test restoring a List with empty items.
-
-        test_list4 = List(Key("default"))
-        test_list4.onUpdateCall(callback)
-        assert test_list4.restoreField("1", None)
-        assert test_list4.restoreField("2", "")
-        assert test_list4.restoreField("3", None)
-        assert len(test_list4) == 3
-        assert not test_list4[0].isSet()
-        assert test_list4[1].isSet() and test_list4[1].get() == ""
-        assert not test_list4[2].isSet()
+    @pytest.mark.parametrize(
+        ("path", "value"),
+        [
+            # Different kinds of invalid restore paths.
+            ("", "test"),
+            ("invalid", "test"),
+            ("invalid.1", "test"),
+            (".", "test"),
+            ("0", "test"),
+            # An invalid restore value.
+            (".size", "invalid"),
+        ],
+        ids=[
+            "empty_path",
+            "invalid_label",
+            "invalid_label_with_index",
+            "empty_labels",
+            "index_zero",
+            "invalid_value",
+        ],
+    )
+    def test_restore_field_rejected(
+        self, callback: CallRecorder, path: str, value: str
+    ) -> None:
+        test_list = List(Key("default"))
+        test_list.onUpdateCall(callback)
+
+        assert not test_list.restoreField(path, value)
+        assert len(test_list) == 0
         callback.assert_not_called()
 
+    @pytest.mark.gc_sensitive
     def test_persistence(self) -> None:
         # A List does not keep a reference to its parent or children.
 
@@ -248,199 +276,163 @@ class TestList:
         level2.setParent(level1)
 
         assert level1.parent() is not None
-        assert len(list(level1.children())) == 1
+        assert sum(1 for _ in level1.children()) == 1
+
+        bunch_list_ref = weakref.ref(bunch_list)
+        level2_ref = weakref.ref(level2)
+
+        # On CPython, refcounting alone must release the Lists: needing a full
+        # collection would mean that Lists hold reference cycles.
 
         del bunch_list
         del level2
-        assert level1.parent() is None
-        assert len(list(level1.children())) == 0
+        if sys.implementation.name != "cpython":
+            gc.collect()
 
-    def test_callback_type_is_flexible(self) -> None:
-        key_list = List(Key(""))
+        assert bunch_list_ref() is None
+        assert level2_ref() is None
+        assert level1.parent() is None
+        assert sum(1 for _ in level1.children()) == 0
 
+    def test_callback_type_is_flexible(self, str_list: List[Key[str]]) -> None:
         class Dummy:
-            pass
+            __slots__ = ()
 
         def callback(_: List[Key[str]]) -> Dummy:
             return Dummy()
 
-        key_list.onUpdateCall(callback)
-
+        str_list.onUpdateCall(callback)
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda key_list: key_list.appendOne(),
+            lambda key_list: key_list.append(Key(default=0)),
+            lambda key_list: key_list.insert(0, Key(default=0)),
+            lambda key_list: key_list.__setitem__(0, Key(default=0)),
+            lambda key_list: key_list.__iadd__([Key(default=0), Key(default=0)]),
+            lambda key_list: key_list.extend([Key(default=0), Key(default=0)]),
+            lambda key_list: key_list.__setitem__(
+                slice(2, 4), [Key(default=0), Key(default=0), Key(default=0)]
+            ),
+            lambda key_list: key_list.pop(),
+            lambda key_list: key_list.__delitem__(0),
+            lambda key_list: key_list.__delitem__(slice(1, 3)),
+            lambda key_list: key_list.clear(),
+        ],
+        ids=[
+            "appendOne",
+            "append",
+            "insert",
+            "setitem",
+            "iadd",
+            "extend",
+            "setslice",
+            "pop",
+            "delitem",
+            "delslice",
+            "clear",
+        ],
+    )
     def test_update_callback_called_on_list_contents_changed(
-        self, mocker: MockerFixture
+        self,
+        callback: CallRecorder,
+        int_list: List[Key[int]],
+        mutate: Callable[[List[Key[int]]], Any],
     ) -> None:
-        callback = mocker.stub()
-
-        key_list: List[Key[int]] = List(Key(default=0))
-
-        key_list.onUpdateCall(callback)
-
-        key_list.appendOne()
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
-
-        key_list.append(Key(default=0))
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
-
-        key_list.insert(0, Key(default=0))
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
+        int_list.extend(Key(default=0) for _ in range(5))
 
-        key_list[0] = Key(default=0)
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
+        int_list.onUpdateCall(callback)
 
-        key_list += [Key(default=0), Key(default=0), Key(default=0)]
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
-
-        key_list.extend([Key(default=0), Key(default=0), Key(default=0)])
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
+        mutate(int_list)
+        callback.assert_called_once_with(int_list)
 
-        key_list[2:4] = [
-            Key(default=0),
-            Key(default=0),
-            Key(default=0),
-        ]
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
-
-        key_list.pop()
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
-
-        key = key_list[0]
-        key_list.remove(key)
-        assert key not in key_list
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
-
-        del key_list[0]
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
+    def test_update_callback_called_on_remove(
+        self, callback: CallRecorder, int_list: List[Key[int]]
+    ) -> None:
+        int_list.extend(Key(default=0) for _ in range(5))
 
-        assert len(key_list[1:3]) == 2
-        del key_list[1:3]
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
+        int_list.onUpdateCall(callback)
 
-        assert len(key_list) > 1
-        key_list.clear()
-        callback.assert_called_once_with(key_list)
-        callback.reset_mock()
+        key = int_list[0]
+        int_list.remove(key)
+        assert key not in int_list
+        callback.assert_called_once_with(int_list)
 
     def test_update_callback_called_on_contained_item_update(
-        self, mocker: MockerFixture
+        self, callback: CallRecorder
     ) -> None:
-        callback = mocker.stub()
-
         bunch_list: List[ExampleBunch] = List(ExampleBunch())
         bunch_list.onUpdateCall(callback)
 
         bunch1 = ExampleBunch()
         bunch_list.append(bunch1)
-        callback.reset_mock()
-        bunch1.test.set("test")
-        callback.assert_called_once_with(bunch1.test)
+        with expect_one_call(callback, bunch1.test):
+            bunch1.test.set("test")
 
         bunch2 = ExampleBunch()
         bunch_list.insert(0, bunch2)
-        callback.reset_mock()
-        bunch2.test.set("test")
-        callback.assert_called_once_with(bunch2.test)
+        with expect_one_call(callback, bunch2.test):
+            bunch2.test.set("test")
 
         bunch3 = ExampleBunch()
         bunch_list[0] = bunch3
-        callback.reset_mock()
-        bunch3.test.set("test")
-        callback.assert_called_once_with(bunch3.test)
+        with expect_one_call(callback, bunch3.test):
+            bunch3.test.set("test")
 
         bunch4 = ExampleBunch()
         bunch5 = ExampleBunch()
         bunch_list[1:2] = [bunch4, bunch5]
-        callback.reset_mock()
-        bunch4.test.set("test")
-        callback.assert_called_once_with(bunch4.test)
-        callback.reset_mock()
-        bunch5.test.set("test")
-        callback.assert_called_once_with(bunch5.test)
+        with expect_one_call(callback, bunch4.test):
+            bunch4.test.set("test")
+        with expect_one_call(callback, bunch5.test):
+            bunch5.test.set("test")
 
         bunch6 = ExampleBunch()
         bunch7 = ExampleBunch()
         bunch_list += [bunch6, bunch7]
-        callback.reset_mock()
-        bunch6.test.set("test")
-        callback.assert_called_once_with(bunch6.test)
-        callback.reset_mock()
-        bunch7.test.set("test")
-        callback.assert_called_once_with(bunch7.test)
+        with expect_one_call(callback, bunch6.test):
+            bunch6.test.set("test")
+        with expect_one_call(callback, bunch7.test):
+            bunch7.test.set("test")
 
         bunch8 = ExampleBunch()
         bunch9 = ExampleBunch()
         bunch_list.extend([bunch8, bunch9])
-        callback.reset_mock()
-        bunch8.test.set("test")
-        callback.assert_called_once_with(bunch8.test)
-        callback.reset_mock()
-        bunch9.test.set("test")
-        callback.assert_called_once_with(bunch9.test)
-
+        with expect_one_call(callback, bunch8.test):
+            bunch8.test.set("test")
+        with expect_one_call(callback, bunch9.test):
+            bunch9.test.set("test")
+
+    @pytest.mark.parametrize(
+        ("remove", "item_count"),
+        [
+            (lambda bunch_list: bunch_list.__delitem__(0), 1),
+            (lambda bunch_list: bunch_list.__delitem__(slice(0, 2)), 2),
+            (lambda bunch_list: bunch_list.clear(), 2),
+            (lambda bunch_list: bunch_list.pop(), 1),
+            (lambda bunch_list: bunch_list.remove(bunch_list[0]), 1),
+        ],
+        ids=["delitem", "delslice", "clear", "pop", "remove"],
+    )
     def test_update_callback_not_called_for_removed_items(
-        self, mocker: MockerFixture
+        self,
+        callback: CallRecorder,
+        remove: Callable[[List[ExampleBunch]], Any],
+        item_count: int,
     ) -> None:
         bunch_list: List[ExampleBunch] = List(ExampleBunch())
+        bunches = [ExampleBunch() for _ in range(item_count)]
 
-        bunch1 = ExampleBunch()
-        bunch2 = ExampleBunch()
-
-        callback = mocker.stub()
         bunch_list.onUpdateCall(callback)
 
-        bunch1.test.clear()
-        bunch_list[:] = [bunch1]
-        del bunch_list[0]
-
-        callback.reset_mock()
-        bunch1.test.set("test")
-        callback.assert_not_called()
-
-        bunch1.test.clear()
-        bunch2.test.clear()
-        bunch_list[:] = [bunch1, bunch2]
-        del bunch_list[0:2]
-
-        callback.reset_mock()
-        bunch1.test.set("test")
-        bunch2.test.set("test")
-        callback.assert_not_called()
-
-        bunch1.test.clear()
-        bunch2.test.clear()
-        bunch_list[:] = [bunch1, bunch2]
-        bunch_list.clear()
-
-        callback.reset_mock()
-        bunch1.test.set("test")
-        bunch2.test.set("test")
-        callback.assert_not_called()
-
-        bunch1.test.clear()
-        bunch_list[:] = [bunch1]
-        bunch_list.pop()
-
-        callback.reset_mock()
-        bunch1.test.set("test")
-        callback.assert_not_called()
-
-        bunch1.test.clear()
-        bunch_list[:] = [bunch1]
-        bunch_list.remove(bunch1)
-        assert bunch1 not in bunch_list
+        bunch_list[:] = bunches
+        remove(bunch_list)
+        assert len(bunch_list) == 0
 
         callback.reset_mock()
-        bunch1.test.set("test")
+        for bunch in bunches:
+            bunch.test.set("test")
         callback.assert_not_called()
 
     def test_repr(self) -> None:
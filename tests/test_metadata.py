@@ -1,3 +1,5 @@
+import pytest
+
 from sunset import Bunch, Key, List, Settings
 
 
@@ -12,6 +14,14 @@ class ExampleSettings(Settings):
     key = Key(default="")
 
 
+@pytest.fixture
+def key_list() -> List[Key[str]]:
+    key_list = List(Key(""))
+    for _ in range(3):
+        key_list.appendOne()
+    return key_list
+
+
 class TestMetadata:
     def test_key_label(self) -> None:
         class TestBunch(Bunch):
@@ -37,75 +47,67 @@ class TestMetadata:
         assert settings.inner_bunch.meta().label == "inner_bunch"
         assert settings.inner_bunch.bunch_key.meta().label == "bunch_key"
 
-    def test_label_set_on_contained_list_items(self) -> None:
-        # Testing List.appendOne()
-
-        key_list = List(Key(""))
+    def test_label_set_on_append_one(self, key_list: List[Key[str]]) -> None:
         key = key_list.appendOne()
-        assert key.meta().label == "1"
-
-        # Testing List.insertOne()
-
-        other_key = key_list.insertOne(0)
-        assert other_key.meta().label == "1"
-        assert key.meta().label == "2"
+        assert key.meta().label == "4"
 
-        # Testing List.append()
+    def test_label_set_on_insert_one(self, key_list: List[Key[str]]) -> None:
+        first_key = key_list[0]
+        key = key_list.insertOne(0)
+        assert key.meta().label == "1"
+        assert first_key.meta().label == "2"
 
+    def test_label_set_on_append(self, key_list: List[Key[str]]) -> None:
         key = Key("")
         assert key.meta().label == ""
         key_list.append(key)
-        assert key.meta().label == "3"
-
-        # Testing List.extend()
-
-        key = Key("")
-        last_key = Key("")
-        key_list.extend((key, last_key))
         assert key.meta().label == "4"
-        assert last_key.meta().label == "5"
-
-        # Testing List.insert()
 
+    def test_label_set_on_extend(self, key_list: List[Key[str]]) -> None:
         key = Key("")
-        key_list.insert(3, key)
+        other_key = Key("")
+        key_list.extend((key, other_key))
         assert key.meta().label == "4"
-        assert last_key.meta().label == "6"
-
-        # Testing List.__setitem__(index)
+        assert other_key.meta().label == "5"
 
+    def test_label_set_on_insert(self, key_list: List[Key[str]]) -> None:
+        last_key = key_list[2]
         key = Key("")
-        key_list[2] = key
-        assert key.meta().label == "3"
-        assert last_key.meta().label == "6"
-
-        # Testing List.__setitem__(slice)
+        key_list.insert(1, key)
+        assert key.meta().label == "2"
+        assert last_key.meta().label == "4"
 
+    def test_label_set_on_setitem_index(self, key_list: List[Key[str]]) -> None:
+        last_key = key_list[2]
         key = Key("")
-        other_key = Key("")
-        key_list[1:4] = [key, other_key]
+        key_list[1] = key
         assert key.meta().label == "2"
-        assert other_key.meta().label == "3"
-        assert last_key.meta().label == "5"
+        assert last_key.meta().label == "3"
 
-        # Testing List.__iadd__()
+    def test_label_set_on_setitem_slice(self, key_list: List[Key[str]]) -> None:
+        last_key = key_list[2]
+        key = Key("")
+        other_key = Key("")
+        key_list[0:1] = [key, other_key]
+        assert key.meta().label == "1"
+        assert other_key.meta().label == "2"
+        assert last_key.meta().label == "4"
 
+    def test_label_set_on_iadd(self, key_list: List[Key[str]]) -> None:
         key = Key("")
         other_key = Key("")
         key_list += [key, other_key]
-        assert key.meta().label == "6"
-        assert other_key.meta().label == "7"
-
-        # Testing assignment order
+        assert key.meta().label == "4"
+        assert other_key.meta().label == "5"
 
-        key_list[2], key_list[4] = key_list[4], key_list[2]
+    def test_label_set_on_swap(self, key_list: List[Key[str]]) -> None:
+        key_list[0], key_list[2] = key_list[2], key_list[0]
+        assert key_list[0].meta().label == "1"
         assert key_list[2].meta().label == "3"
-        assert key_list[4].meta().label == "5"
 
     def test_label_unset_on_removed_list_items(self) -> None:
         key_list = List(Key(""))
-        for _ in range(15):
-            key_list.appendOne()
+        key_list.extend(Key("") for _ in range(15))
 
         # Test List.__delitem__(index)
 
@@ -144,9 +146,9 @@ class TestMetadata:
 
         # Test List.clear()
 
-        keys = key_list[:]
+        keys = tuple(key_list)
         key_list.clear()
-        assert all(key.meta().label == "" for key in keys)
+        assert not any(key.meta().label for key in keys)
 
     def test_paths(self) -> None:
         settings = ExampleSettings()
@@ -1,6 +1,8 @@
 from collections.abc import MutableSet
 from typing import Any
 
+import pytest
+
 from sunset import sets
 
 
@@ -28,6 +30,7 @@ class TestNonHashableSet:
         assert len(s) == 0
         assert list(s) == []
 
+    @pytest.mark.gc_sensitive
     def test_persistence(self) -> None:
         s: MutableSet[Any] = sets.NonHashableSet()
         item = Dummy()
@@ -59,6 +62,7 @@ class TestWeakNonHashableSet:
         assert len(s) == 0
         assert list(s) == []
 
+    @pytest.mark.gc_sensitive
     def test_persistence(self) -> None:
         s: MutableSet[Any] = sets.WeakNonHashableSet()
         item = Dummy()
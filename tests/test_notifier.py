@@ -1,3 +1,4 @@
+import pytest
 from pytest_mock import MockerFixture
 
 from sunset.notifier import Notifier
@@ -65,6 +66,7 @@ class TestNotifier:
 
         notifier.discard(lambda _: None)
 
+    @pytest.mark.gc_sensitive
     def test_notifier_doesnt_keep_reference_to_function(
         self, mocker: MockerFixture
     ) -> None:
@@ -116,3 +118,21 @@ class TestNotifier:
 
         notifier.trigger("test")
         callback.assert_called_once_with("test")
+
+    def test_callback_can_add_callback_during_trigger(
+        self, mocker: MockerFixture
+    ) -> None:
+        notifier = Notifier[str]()
+
+        callback = mocker.stub()
+
+        def adder(_: str) -> None:
+            notifier.add(callback)
+
+        notifier.add(adder)
+
+        notifier.trigger("test")
+        callback.assert_not_called()
+
+        notifier.trigger("test")
+        callback.assert_called_once_with("test")
@@ -1,18 +1,5 @@
-from typing import Optional
-
 from sunset import serializers
-
-
-class ExampleSerializable:
-    def __init__(self, value: str) -> None:
-        self._value = value
-
-    def toStr(self) -> str:
-        return self._value
-
-    @staticmethod
-    def fromStr(string: str) -> Optional["ExampleSerializable"]:
-        return ExampleSerializable(string)
+from tests.helpers import ExampleSerializable
 
 
 def test_serialize_int() -> None:
@@ -67,16 +54,30 @@ def test_deserialize_int() -> None:
     serializer = serializers.lookup(int)
     assert serializer is not None
     assert serializer.fromStr("test") is None
+    assert serializer.fromStr("") is None
+    assert serializer.fromStr("  ") is None
+    assert serializer.fromStr("-x1") is None
+    assert serializer.fromStr("12error") is None
     assert serializer.fromStr("   -32 ") == -32
+    assert serializer.fromStr(" +32") == 32
     assert serializer.fromStr("00017") == 17
+    assert serializer.fromStr("1_000") == 1000
 
 
 def test_deserialize_float() -> None:
     serializer = serializers.lookup(float)
     assert serializer is not None
     assert serializer.fromStr("test") is None
+    assert serializer.fromStr("") is None
+    assert serializer.fromStr("-x1") is None
     assert serializer.fromStr("   -32.10 ") == -32.1
     assert serializer.fromStr("2.34e-56") == 2.34e-56
+    assert serializer.fromStr("-.5") == -0.5
+    assert serializer.fromStr(" Infinity") == float("inf")
+    assert serializer.fromStr("-inf") == float("-inf")
+    nan = serializer.fromStr("NaN")
+    assert nan is not None
+    assert nan != nan
 
 
 def test_deserialize_bool() -> None:
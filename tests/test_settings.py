@@ -1,5 +1,6 @@
 import io
 
+import pytest
 from pytest_mock import MockerFixture
 
 from sunset import Bunch, Key, List, Settings, normalize
@@ -220,6 +221,7 @@ class TestSettings:
         assert not other_settings.isSet()
         callback.assert_not_called()
 
+    @pytest.mark.gc_sensitive
     def test_persistence(self) -> None:
         # Settings keep a reference to their sections, but not to their parent.
 